@@ -330,7 +330,7 @@ def sendCmd( self, *args, **kwargs ):
         # Convert to string
         if not isinstance( cmd, str ):
             cmd = ' '.join( [ str( c ) for c in cmd ] )
-        if not re.search( r'\w', cmd ):
+        if not self._wordRegex.search( cmd ):
             # Replace empty commands with something harmless
             cmd = 'echo -n'
         self.lastCmd = cmd
@@ -350,6 +350,10 @@ def sendInt( self, intr=chr( 3 ) ):
         debug( 'sendInt: writing chr(%d)\n' % ord( intr ) )
         self.write( intr )
 
+    _wordRegex = re.compile( r'\w' )
+    _pidRegex = re.compile( r'\[\d+\] \d+\r\n' )
+    _markerRegex = re.compile( chr( 1 ) + r'\d+\r\n' )
+
     def monitor( self, timeoutms=None, findPid=True ):
         """Monitor and return the output of a command.
            Set self.waiting to False if command has completed.
@@ -359,20 +363,18 @@ def monitor( self, timeoutms=None, findPid=True ):
         if not ready:
             return ''
         data = self.read( 1024 )
-        pidre = r'\[\d+\] \d+\r\n'
         # Look for PID
-        marker = chr( 1 ) + r'\d+\r\n'
         if findPid and chr( 1 ) in data:
             # suppress the job and PID of a backgrounded command
-            if re.findall( pidre, data ):
-                data = re.sub( pidre, '', data )
+            if self._pidRegex.search( data ):
+                data = self._pidRegex.sub( '', data )
             # Marker can be read in chunks; continue until all of it is read
-            while not re.findall( marker, data ):
+            while not self._markerRegex.search( data ):
                 data += self.read( 1024 )
-            markers = re.findall( marker, data )
+            markers = self._markerRegex.findall( data )
             if markers:
                 self.lastPid = int( markers[ 0 ][ 1: ] )
-                data = re.sub( marker, '', data )
+                data = self._markerRegex.sub( '', data )
         # Look for sentinel/EOF
         if len( data ) > 0 and data[ -1 ] == chr( 127 ):
             self.waiting = False